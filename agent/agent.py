@@ -1,34 +1,90 @@
 """
 LangChain agent for finding restaurants that are currently open.
 """
-from typing import List, Optional
-from langchain.agents import AgentExecutor, create_openai_functions_agent
+import asyncio
+import os
+import queue
+import threading
+from typing import Any, Iterator, List, Optional, Set
+from langchain.agents import AgentExecutor, create_openai_tools_agent
 from langchain.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain.memory import ConversationBufferMemory
+from langchain.memory import ConversationTokenBufferMemory
 from langchain.schema.messages import SystemMessage
 from langchain.tools import BaseTool
 from langchain.chat_models import ChatOpenAI
 
-from agent.tools import FindNearbyRestaurantsTool, GetRestaurantDetailsTool
-from services.places_api import GooglePlacesService
+from agent.tools import (
+    BatchRestaurantDetailsTool,
+    FindAndDetailRestaurantsTool,
+    FindNearbyRestaurantsTool,
+    GetRestaurantDetailsTool
+)
+from services.places_api import AsyncGooglePlacesService, GooglePlacesService
+
+# Models used for the agent; the default can be overridden with FINDMYDINNER_MODEL
+DEFAULT_MODEL = "gpt-4o-mini"
+PREMIUM_MODEL = "gpt-4o"
+
+# Token budget for the conversation history sent with every request
+MEMORY_MAX_TOKENS = 2000
+
+# Tokenizer used to measure the history. It only has to be a name that langchain's
+# token counter and tiktoken (>= 0.7) both know, whatever model FINDMYDINNER_MODEL selects.
+TOKEN_COUNT_MODEL = "gpt-4o-mini"
+
+# Marks the end of a streamed response
+_STREAM_DONE = object()
+
+# Answer used when the agent produces no output
+_NO_ANSWER = "I couldn't find an answer to your question."
+
+# Event loop shared by all agents for the async path, running on a background thread.
+# It lives for the whole process so the async Places client keeps its connections.
+_LOOP: Optional[asyncio.AbstractEventLoop] = None
+_LOOP_LOCK = threading.Lock()
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background event loop, starting it on first use.
+    
+    Returns:
+        The running event loop
+    """
+    global _LOOP
+    with _LOOP_LOCK:
+        if _LOOP is None:
+            _LOOP = asyncio.new_event_loop()
+            threading.Thread(
+                target=_LOOP.run_forever,
+                name="findmydinner-agent-loop",
+                daemon=True
+            ).start()
+        return _LOOP
 
 class FindMyDinnerAgent:
     """
     Agent for finding restaurants that are currently open near a specified location.
     """
     
-    def __init__(self, openai_api_key: str, places_api_key: Optional[str] = None):
+    def __init__(
+        self,
+        openai_api_key: str,
+        places_api_key: Optional[str] = None,
+        use_premium_model: bool = False
+    ):
         """
         Initialize the FindMyDinner agent.
         
         Args:
             openai_api_key: OpenAI API key for the language model
             places_api_key: Google Places API key (optional, will use env var if not provided)
+            use_premium_model: Use the larger, slower model instead of the configured default
         """
         self.openai_api_key = openai_api_key
         
-        # Initialize the Google Places service
+        # Initialize the Google Places services
         self.places_service = GooglePlacesService(api_key=places_api_key)
+        self.async_places_service = AsyncGooglePlacesService(api_key=places_api_key)
         
         # Initialize the tools
         self.tools = self._create_tools()
@@ -36,8 +92,11 @@ class FindMyDinnerAgent:
         # Initialize the language model
         self.llm = ChatOpenAI(
             temperature=0,
-            model="gpt-4o",
-            api_key=openai_api_key
+            model=PREMIUM_MODEL if use_premium_model else os.getenv("FINDMYDINNER_MODEL", DEFAULT_MODEL),
+            api_key=openai_api_key,
+            streaming=True,
+            model_kwargs={"parallel_tool_calls": True},
+            tiktoken_model_name=TOKEN_COUNT_MODEL
         )
         
         # Create the agent
@@ -51,8 +110,22 @@ class FindMyDinnerAgent:
             List of tools
         """
         return [
-            FindNearbyRestaurantsTool(places_service=self.places_service),
-            GetRestaurantDetailsTool(places_service=self.places_service)
+            FindNearbyRestaurantsTool(
+                places_service=self.places_service,
+                async_places_service=self.async_places_service
+            ),
+            GetRestaurantDetailsTool(
+                places_service=self.places_service,
+                async_places_service=self.async_places_service
+            ),
+            BatchRestaurantDetailsTool(
+                places_service=self.places_service,
+                async_places_service=self.async_places_service
+            ),
+            FindAndDetailRestaurantsTool(
+                places_service=self.places_service,
+                async_places_service=self.async_places_service
+            )
         ]
     
     def _create_agent(self) -> AgentExecutor:
@@ -71,9 +144,15 @@ Your goal is to help users find places to eat based on their location, preferenc
 You have access to tools that can:
 1. Find nearby restaurants that are currently open
 2. Get detailed information about specific restaurants
+3. Get detailed information about several restaurants at once
+4. Find nearby restaurants and get details about the top results in one step
 
 When users ask about finding food or restaurants, use the find_nearby_restaurants tool.
 When they want more details about a specific restaurant, use the get_restaurant_details tool.
+When fetching details for multiple restaurants, use batch_restaurant_details with all place_ids at once.
+When users want to find restaurants and also see details about the top results, use find_and_detail_restaurants.
+
+When you need multiple independent pieces of information, emit all the relevant tool calls in a single response so they can run in parallel. Only call tools sequentially when a later call depends on an earlier result.
 
 Always be helpful, concise, and focused on helping the user find a place to eat.
 """
@@ -87,13 +166,18 @@ Always be helpful, concise, and focused on helping the user find a place to eat.
             MessagesPlaceholder(variable_name="agent_scratchpad")
         ])
         
-        # Create memory
-        memory = ConversationBufferMemory(memory_key="chat_history", return_messages=True)
+        # Create memory; the oldest messages are dropped once the history exceeds the budget
+        memory = ConversationTokenBufferMemory(
+            llm=self.llm,
+            memory_key="chat_history",
+            return_messages=True,
+            max_token_limit=MEMORY_MAX_TOKENS
+        )
         
         # Create the agent
-        agent = create_openai_functions_agent(self.llm, self.tools, prompt)
+        agent = create_openai_tools_agent(self.llm, self.tools, prompt)
         
-        # Create the agent executor
+        # Create the agent executor; on the async path it awaits all tool calls of a step together
         return AgentExecutor(
             agent=agent,
             tools=self.tools,
@@ -113,4 +197,105 @@ Always be helpful, concise, and focused on helping the user find a place to eat.
             Agent response
         """
         result = self.agent_executor.invoke({"input": query})
-        return result.get("output", "I couldn't find an answer to your question.")
+        return result.get("output", _NO_ANSWER)
+    
+    def stream(self, query: str) -> Iterator[str]:
+        """
+        Run the agent with a user query and yield the answer as it arrives.
+        
+        The agent runs on the shared background event loop, so tools use the async
+        Places service. Tokens are yielded as soon as the model generates them.
+        Closing the generator early cancels the run.
+        
+        Args:
+            query: User query
+            
+        Yields:
+            Pieces of the agent response
+        """
+        tokens: "queue.Queue[Any]" = queue.Queue()
+        future = asyncio.run_coroutine_threadsafe(self._astream_answer(query, tokens), _get_event_loop())
+        
+        try:
+            while (token := tokens.get()) is not _STREAM_DONE:
+                yield token
+            
+            # Re-raise anything the agent raised
+            future.result()
+        finally:
+            # Stop the agent if the caller stopped reading, e.g. an abandoned Streamlit rerun
+            future.cancel()
+    
+    async def _astream_answer(self, query: str, tokens: "queue.Queue[Any]") -> None:
+        """
+        Run the agent and put the generated tokens on a queue as they arrive.
+        
+        Text is forwarded for every generation that has not produced a tool call.
+        When a generation turns to tool calls after some text, a paragraph break
+        is forwarded so that preamble stays apart from the answer that follows.
+        
+        Args:
+            query: User query
+            tokens: Queue receiving the answer tokens, followed by _STREAM_DONE
+        """
+        try:
+            root_run_id = None
+            output = None
+            tool_call_runs: Set[str] = set()
+            answer_runs: Set[str] = set()
+            
+            async for event in self.agent_executor.astream_events({"input": query}, version="v1"):
+                kind = event["event"]
+                run_id = event["run_id"]
+                if root_run_id is None:
+                    root_run_id = run_id
+                
+                if kind == "on_chat_model_stream" and run_id not in tool_call_runs:
+                    chunk = event["data"]["chunk"]
+                    if getattr(chunk, "tool_call_chunks", None) or chunk.additional_kwargs.get("tool_calls"):
+                        tool_call_runs.add(run_id)
+                        if run_id in answer_runs:
+                            answer_runs.discard(run_id)
+                            tokens.put("\n\n")
+                    elif chunk.content:
+                        answer_runs.add(run_id)
+                        tokens.put(chunk.content)
+                elif kind == "on_chain_end" and run_id == root_run_id:
+                    output = event["data"].get("output")
+            
+            # Fall back to the executor's output if no answer was generated,
+            # e.g. when it stopped at the iteration limit
+            if not answer_runs:
+                tokens.put(output.get("output", _NO_ANSWER) if isinstance(output, dict) else _NO_ANSWER)
+        finally:
+            tokens.put(_STREAM_DONE)
+    
+    async def arun(self, query: str) -> str:
+        """
+        Run the agent asynchronously with a user query.
+        
+        Tool calls planned in the same step are awaited together, so their
+        Google Places requests are in flight at the same time. The query runs on
+        the shared background event loop, whichever loop awaits this method.
+        
+        Args:
+            query: User query
+            
+        Returns:
+            Agent response
+        """
+        future = asyncio.run_coroutine_threadsafe(self._ainvoke(query), _get_event_loop())
+        return await asyncio.wrap_future(future)
+    
+    async def _ainvoke(self, query: str) -> str:
+        """
+        Run the agent on the current event loop.
+        
+        Args:
+            query: User query
+            
+        Returns:
+            Agent response
+        """
+        result = await self.agent_executor.ainvoke({"input": query})
+        return result.get("output", _NO_ANSWER)
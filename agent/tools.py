@@ -1,30 +1,249 @@
 """
 Custom LangChain tools for interacting with the Google Places API.
 """
-from typing import Optional, ClassVar
+import asyncio
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Dict, List, Optional, ClassVar
 from langchain.tools import BaseTool
 from pydantic import BaseModel, Field, ConfigDict
-from services.places_api import GooglePlacesService
+from services.places_api import AsyncGooglePlacesService, GooglePlacesService
 from utils.helpers import format_place_for_display, format_place_details, parse_distance
 
+# Coordinate pair such as "40.7580,-73.9855"
+_LATLNG_RE = re.compile(r"\s*(-?\d+(?:\.\d+)?)\s*,\s*(-?\d+(?:\.\d+)?)\s*")
+
+def _parse_lat_lng(location: str) -> Optional[tuple[float, float]]:
+    """
+    Parse a 'latitude,longitude' string.
+    
+    Args:
+        location: Location text from the user
+        
+    Returns:
+        Tuple of (latitude, longitude) or None if the text is not a coordinate pair
+    """
+    match = _LATLNG_RE.fullmatch(location)
+    if match:
+        return float(match[1]), float(match[2])
+    return None
+
+def _search_nearby(
+    places_service: GooglePlacesService,
+    location: str,
+    radius: str,
+    keyword: Optional[str]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Search for open restaurants near a location given as text.
+    
+    Args:
+        places_service: Service used for geocoding and the search
+        location: Location to search near (address or 'latitude,longitude')
+        radius: Search radius in meters, or with units like '5 km'
+        keyword: Optional keyword to filter results
+        
+    Returns:
+        Places returned by the Google Places API, or None if the address could not be geocoded
+    """
+    # Parse the location, treating anything that is not "latitude,longitude" as an address
+    geo_location = _parse_lat_lng(location) or places_service.geocode_address(location)
+    if not geo_location:
+        return None
+    
+    return places_service.find_nearby_places(**_nearby_search_params(geo_location, radius, keyword))
+
+async def _asearch_nearby(
+    async_places_service: AsyncGooglePlacesService,
+    location: str,
+    radius: str,
+    keyword: Optional[str]
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Search asynchronously for open restaurants near a location given as text.
+    
+    Args:
+        async_places_service: Service used for geocoding and the search
+        location: Location to search near (address or 'latitude,longitude')
+        radius: Search radius in meters, or with units like '5 km'
+        keyword: Optional keyword to filter results
+        
+    Returns:
+        Places returned by the Google Places API, or None if the address could not be geocoded
+    """
+    # Parse the location, treating anything that is not "latitude,longitude" as an address
+    geo_location = _parse_lat_lng(location) or await async_places_service.geocode_address(location)
+    if not geo_location:
+        return None
+    
+    return await async_places_service.find_nearby_places(**_nearby_search_params(geo_location, radius, keyword))
+
+def _nearby_search_params(
+    geo_location: tuple[float, float],
+    radius: str,
+    keyword: Optional[str]
+) -> Dict[str, Any]:
+    """
+    Build the nearby search arguments shared by the sync and async searches.
+    
+    Args:
+        geo_location: Tuple of (latitude, longitude) to search near
+        radius: Search radius in meters, or with units like '5 km'
+        keyword: Optional keyword to filter results
+        
+    Returns:
+        Keyword arguments for find_nearby_places
+    """
+    return {
+        "location": geo_location,
+        "radius": parse_distance(radius) or 1000,
+        "open_now": True,
+        "type": "restaurant",
+        "keyword": keyword
+    }
+
+def _format_nearby_results(location: str, radius: str, places: List[Dict[str, Any]]) -> str:
+    """
+    Build the response for a nearby restaurant search.
+    
+    Args:
+        location: Location the search was made near
+        radius: Search radius as given by the user
+        places: Places returned by the Google Places API
+        
+    Returns:
+        A string representation of the search results
+    """
+    if not places:
+        return f"No open restaurants found near {location} within {radius}"
+    
+    # Format the results
+    formatted_places = [format_place_for_display(place) for place in places]
+    
+    # Create a readable response
+    lines = [f"Found {len(formatted_places)} open restaurants near {location}:", ""]
+    
+    for i, place in enumerate(formatted_places, 1):
+        lines.append(f"{i}. {place.name}")
+        lines.append(f"   Address: {place.address}")
+        lines.append(f"   Rating: {place.rating} stars")
+        lines.append(f"   Price: {place.price_level}")
+        lines.append(f"   Place ID: {place.place_id}")
+        lines.append("")
+    
+    lines.append(
+        "To get more details about a specific restaurant, use the get_restaurant_details tool with its Place ID, "
+        "or batch_restaurant_details with several Place IDs."
+    )
+    
+    return "\n".join(lines)
+
+def _format_details_result(place_id: str, place_details: Dict[str, Any]) -> str:
+    """
+    Build the response for a restaurant details lookup.
+    
+    Args:
+        place_id: Google Places ID of the restaurant
+        place_details: Place details returned by the Google Places API
+        
+    Returns:
+        A string representation of the restaurant details
+    """
+    if not place_details:
+        return f"No details found for place_id: {place_id}"
+    
+    # Format the details
+    formatted_details = format_place_details(place_details)
+    
+    # Create a readable response
+    lines = [
+        f"Details for {formatted_details.name}:",
+        "",
+        f"Address: {formatted_details.address}",
+        f"Phone: {formatted_details.phone}",
+        f"Website: {formatted_details.website}",
+        f"Rating: {formatted_details.rating} stars",
+        f"Price: {formatted_details.price_level}",
+        ""
+    ]
+    
+    # Add opening hours if available
+    if formatted_details.weekday_text:
+        lines.append("Opening Hours:")
+        lines.extend(f"- {hours}" for hours in formatted_details.weekday_text)
+    
+    return "\n".join(lines) + "\n"
+
+def _format_find_and_detail_results(
+    location: str,
+    radius: str,
+    places: List[Dict[str, Any]],
+    place_ids: List[str],
+    all_details: List[Dict[str, Any]]
+) -> str:
+    """
+    Build the response for a combined search and details lookup.
+    
+    Args:
+        location: Location the search was made near
+        radius: Search radius as given by the user
+        places: Places returned by the nearby search
+        place_ids: Google Places IDs of the restaurants that were looked up
+        all_details: Place details for each of the place_ids, in the same order
+        
+    Returns:
+        A string representation of the search results followed by the details
+    """
+    sections = [_format_nearby_results(location, radius, places)]
+    sections.extend(
+        _format_details_result(place_id, place_details)
+        for place_id, place_details in zip(place_ids, all_details)
+    )
+    return "\n\n".join(sections)
+
+class _PlacesTool(BaseTool):
+    """
+    Base class for tools backed by the Google Places services.
+    
+    Subclasses implement ``_run`` with the sync service and ``_places_arun`` with the
+    async one; without an async service, async calls run ``_run`` in an executor.
+    """
+    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
+    places_service: GooglePlacesService
+    async_places_service: Optional[AsyncGooglePlacesService] = Field(default=None)
+    
+    def __init__(
+        self,
+        places_service: GooglePlacesService,
+        async_places_service: Optional[AsyncGooglePlacesService] = None
+    ):
+        """Initialize the tool with a GooglePlacesService and an optional AsyncGooglePlacesService."""
+        if places_service is None:
+            raise ValueError("A GooglePlacesService instance is required.")
+        super().__init__(places_service=places_service, async_places_service=async_places_service)
+    
+    async def _arun(self, *args: Any, **kwargs: Any) -> str:
+        """Run the tool asynchronously, falling back to ``_run`` in an executor."""
+        if self.async_places_service is None:
+            return await asyncio.get_running_loop().run_in_executor(None, partial(self._run, *args, **kwargs))
+        return await self._places_arun(*args, **kwargs)
+    
+    async def _places_arun(self, *args: Any, **kwargs: Any) -> str:
+        """Run the tool with the async Places service."""
+        raise NotImplementedError
+
 class FindNearbyRestaurantsInput(BaseModel):
     """Input for FindNearbyRestaurants tool."""
     location: str = Field(..., description="Location to search near (address or 'latitude,longitude')")
     radius: str = Field(default="1000", description="Search radius in meters, or with units like '5 km'")
     keyword: Optional[str] = Field(default=None, description="Optional keyword to filter results (e.g., 'pizza', 'italian')")
 
-class FindNearbyRestaurantsTool(BaseTool):
+class FindNearbyRestaurantsTool(_PlacesTool):
     """Tool for finding nearby restaurants that are currently open."""
     name: str = "find_nearby_restaurants"
     description: str = "Find restaurants that are currently open near a specified location"
     args_schema: type[FindNearbyRestaurantsInput] = FindNearbyRestaurantsInput
-    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
-    places_service: GooglePlacesService = Field(default=None)
-    
-    def __init__(self, places_service: Optional[GooglePlacesService] = None):
-        """Initialize the tool with a GooglePlacesService instance."""
-        super().__init__()
-        self.places_service = places_service or GooglePlacesService()
     
     def _run(self, location: str, radius: str = "1000", keyword: Optional[str] = None) -> str:
         """
@@ -38,65 +257,39 @@ class FindNearbyRestaurantsTool(BaseTool):
         Returns:
             A string representation of the search results
         """
-        # Parse the radius
-        radius_meters = parse_distance(radius) or 1000
-        
-        # Parse the location
-        if "," in location and all(part.strip().replace(".", "", 1).replace("-", "", 1).isdigit() 
-                                for part in location.split(",")):
-            # Looks like "latitude,longitude"
-            lat, lng = map(float, location.split(","))
-            geo_location = (lat, lng)
-        else:
-            # Treat as address
-            geo_location = self.places_service.geocode_address(location)
-            if not geo_location:
-                return f"Could not geocode address: {location}"
-        
-        # Find nearby restaurants
-        places = self.places_service.find_nearby_places(
-            location=geo_location,
-            radius=radius_meters,
-            open_now=True,
-            type="restaurant",
-            keyword=keyword
-        )
-        
-        if not places:
-            return f"No open restaurants found near {location} within {radius}"
-        
-        # Format the results
-        formatted_places = [format_place_for_display(place) for place in places]
+        places = _search_nearby(self.places_service, location, radius, keyword)
+        if places is None:
+            return f"Could not geocode address: {location}"
         
-        # Create a readable response
-        result = f"Found {len(formatted_places)} open restaurants near {location}:\n\n"
-        
-        for i, place in enumerate(formatted_places, 1):
-            result += f"{i}. {place['name']}\n"
-            result += f"   Address: {place['address']}\n"
-            result += f"   Rating: {place['rating']} stars\n"
-            result += f"   Price: {place['price_level']}\n\n"
+        return _format_nearby_results(location, radius, places)
+    
+    async def _places_arun(self, location: str, radius: str = "1000", keyword: Optional[str] = None) -> str:
+        """
+        Run the tool asynchronously to find nearby restaurants.
         
-        result += "To get more details about a specific restaurant, use the get_restaurant_details tool with the place_id."
+        Args:
+            location: Location to search near (address or 'latitude,longitude')
+            radius: Search radius in meters, or with units like '5 km'
+            keyword: Optional keyword to filter results
+            
+        Returns:
+            A string representation of the search results
+        """
+        places = await _asearch_nearby(self.async_places_service, location, radius, keyword)
+        if places is None:
+            return f"Could not geocode address: {location}"
         
-        return result
+        return _format_nearby_results(location, radius, places)
 
 class GetRestaurantDetailsInput(BaseModel):
     """Input for GetRestaurantDetails tool."""
     place_id: str = Field(..., description="Google Places ID of the restaurant")
 
-class GetRestaurantDetailsTool(BaseTool):
+class GetRestaurantDetailsTool(_PlacesTool):
     """Tool for getting detailed information about a specific restaurant."""
     name: str = "get_restaurant_details"
     description: str = "Get detailed information about a specific restaurant by its place_id"
     args_schema: type[GetRestaurantDetailsInput] = GetRestaurantDetailsInput
-    model_config: ClassVar[ConfigDict] = ConfigDict(arbitrary_types_allowed=True)
-    places_service: GooglePlacesService = Field(default=None)
-    
-    def __init__(self, places_service: Optional[GooglePlacesService] = None):
-        """Initialize the tool with a GooglePlacesService instance."""
-        super().__init__()
-        self.places_service = places_service or GooglePlacesService()
     
     def _run(self, place_id: str) -> str:
         """
@@ -111,24 +304,139 @@ class GetRestaurantDetailsTool(BaseTool):
         # Get place details
         place_details = self.places_service.get_place_details(place_id)
         
-        if not place_details:
-            return f"No details found for place_id: {place_id}"
+        return _format_details_result(place_id, place_details)
+    
+    async def _places_arun(self, place_id: str) -> str:
+        """
+        Run the tool asynchronously to get restaurant details.
+        
+        Args:
+            place_id: Google Places ID of the restaurant
+            
+        Returns:
+            A string representation of the restaurant details
+        """
+        # Get place details
+        place_details = await self.async_places_service.get_place_details(place_id)
+        
+        return _format_details_result(place_id, place_details)
+
+class BatchRestaurantDetailsInput(BaseModel):
+    """Input for BatchRestaurantDetails tool."""
+    place_ids: List[str] = Field(..., min_length=1, max_length=10, description="Google Places IDs of the restaurants")
+
+class BatchRestaurantDetailsTool(_PlacesTool):
+    """Tool for getting detailed information about several restaurants in one call."""
+    name: str = "batch_restaurant_details"
+    description: str = "Get detailed information about several restaurants at once by their place_ids"
+    args_schema: type[BatchRestaurantDetailsInput] = BatchRestaurantDetailsInput
+    # More than 10 ids fails validation; report that back to the model instead of failing the turn
+    handle_validation_error: bool = True
+    
+    def _run(self, place_ids: List[str]) -> str:
+        """
+        Run the tool to get details for several restaurants concurrently.
+        
+        Args:
+            place_ids: Google Places IDs of the restaurants
+            
+        Returns:
+            A string representation of the details of every restaurant
+        """
+        # Fetch all details at once; map keeps the results in request order
+        with ThreadPoolExecutor(max_workers=len(place_ids)) as executor:
+            all_details = list(executor.map(self.places_service.get_place_details, place_ids))
         
-        # Format the details
-        formatted_details = format_place_details(place_details)
+        return "\n".join(
+            _format_details_result(place_id, place_details)
+            for place_id, place_details in zip(place_ids, all_details)
+        )
+    
+    async def _places_arun(self, place_ids: List[str]) -> str:
+        """
+        Run the tool asynchronously to get details for several restaurants concurrently.
         
-        # Create a readable response
-        result = f"Details for {formatted_details['name']}:\n\n"
-        result += f"Address: {formatted_details['address']}\n"
-        result += f"Phone: {formatted_details['phone']}\n"
-        result += f"Website: {formatted_details['website']}\n"
-        result += f"Rating: {formatted_details['rating']} stars\n"
-        result += f"Price: {formatted_details['price_level']}\n\n"
+        Args:
+            place_ids: Google Places IDs of the restaurants
+            
+        Returns:
+            A string representation of the details of every restaurant
+        """
+        # Fetch all details at once; gather keeps the results in request order
+        all_details = await asyncio.gather(
+            *(self.async_places_service.get_place_details(place_id) for place_id in place_ids)
+        )
         
-        # Add opening hours if available
-        if formatted_details.get('opening_hours') and formatted_details['opening_hours'].get('weekday_text'):
-            result += "Opening Hours:\n"
-            for hours in formatted_details['opening_hours']['weekday_text']:
-                result += f"- {hours}\n"
+        return "\n".join(
+            _format_details_result(place_id, place_details)
+            for place_id, place_details in zip(place_ids, all_details)
+        )
+
+class FindAndDetailRestaurantsInput(BaseModel):
+    """Input for FindAndDetailRestaurants tool."""
+    location: str = Field(..., description="Location to search near (address or 'latitude,longitude')")
+    radius: str = Field(default="1000", description="Search radius in meters, or with units like '5 km'")
+    keyword: Optional[str] = Field(default=None, description="Optional keyword to filter results (e.g., 'pizza', 'italian')")
+    top_k: int = Field(default=3, ge=1, le=10, description="Number of top results to get detailed information about")
+
+class FindAndDetailRestaurantsTool(_PlacesTool):
+    """Tool for finding open restaurants and getting details about the top results in one call."""
+    name: str = "find_and_detail_restaurants"
+    description: str = (
+        "Find restaurants that are currently open near a specified location and get detailed "
+        "information about the top results in a single step"
+    )
+    args_schema: type[FindAndDetailRestaurantsInput] = FindAndDetailRestaurantsInput
+    
+    def _run(self, location: str, radius: str = "1000", keyword: Optional[str] = None, top_k: int = 3) -> str:
+        """
+        Run the tool to find nearby restaurants and get details about the top results.
+        
+        Args:
+            location: Location to search near (address or 'latitude,longitude')
+            radius: Search radius in meters, or with units like '5 km'
+            keyword: Optional keyword to filter results
+            top_k: Number of top results to get details about
+            
+        Returns:
+            A string representation of the search results followed by the details
+        """
+        places = _search_nearby(self.places_service, location, radius, keyword)
+        if places is None:
+            return f"Could not geocode address: {location}"
+        if not places:
+            return _format_nearby_results(location, radius, places)
+        
+        # The detail lookups only depend on the search, so they run concurrently
+        place_ids = [place["place_id"] for place in places[:top_k]]
+        with ThreadPoolExecutor(max_workers=len(place_ids)) as executor:
+            all_details = list(executor.map(self.places_service.get_place_details, place_ids))
+        
+        return _format_find_and_detail_results(location, radius, places, place_ids, all_details)
+    
+    async def _places_arun(self, location: str, radius: str = "1000", keyword: Optional[str] = None, top_k: int = 3) -> str:
+        """
+        Run the tool asynchronously to find nearby restaurants and get details about the top results.
+        
+        Args:
+            location: Location to search near (address or 'latitude,longitude')
+            radius: Search radius in meters, or with units like '5 km'
+            keyword: Optional keyword to filter results
+            top_k: Number of top results to get details about
+            
+        Returns:
+            A string representation of the search results followed by the details
+        """
+        places = await _asearch_nearby(self.async_places_service, location, radius, keyword)
+        if places is None:
+            return f"Could not geocode address: {location}"
+        if not places:
+            return _format_nearby_results(location, radius, places)
+        
+        # The detail lookups only depend on the search, so they run concurrently
+        place_ids = [place["place_id"] for place in places[:top_k]]
+        all_details = await asyncio.gather(
+            *(self.async_places_service.get_place_details(place_id) for place_id in place_ids)
+        )
         
-        return result
+        return _format_find_and_detail_results(location, radius, places, place_ids, all_details)
@@ -20,6 +20,28 @@ st.set_page_config(
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 GOOGLE_PLACES_API_KEY = os.getenv("GOOGLE_PLACES_API_KEY")
 
+def set_agent(openai_key: str, places_key: str):
+    """
+    Store an agent for the given API keys in the session state.
+    
+    The current agent, and with it the conversation memory, is kept as long as the
+    keys do not change. Agents are not shared between sessions because each one
+    holds its user's conversation.
+    
+    Args:
+        openai_key: OpenAI API key
+        places_key: Google Places API key
+    """
+    keys = (openai_key, places_key)
+    if st.session_state.get("agent") is not None and st.session_state.get("agent_keys") == keys:
+        return
+    
+    st.session_state.agent = FindMyDinnerAgent(
+        openai_api_key=openai_key,
+        places_api_key=places_key
+    )
+    st.session_state.agent_keys = keys
+
 def initialize_session_state():
     """Initialize session state variables."""
     if "messages" not in st.session_state:
@@ -27,10 +49,7 @@ def initialize_session_state():
     
     if "agent" not in st.session_state:
         if OPENAI_API_KEY and GOOGLE_PLACES_API_KEY:
-            st.session_state.agent = FindMyDinnerAgent(
-                openai_api_key=OPENAI_API_KEY,
-                places_api_key=GOOGLE_PLACES_API_KEY
-            )
+            set_agent(OPENAI_API_KEY, GOOGLE_PLACES_API_KEY)
         else:
             st.session_state.agent = None
 
@@ -63,10 +82,7 @@ def main():
         
         if st.button("Save Keys"):
             if openai_key and places_key:
-                st.session_state.agent = FindMyDinnerAgent(
-                    openai_api_key=openai_key,
-                    places_api_key=places_key
-                )
+                set_agent(openai_key, places_key)
                 st.success("API keys saved successfully!")
             else:
                 st.error("Both API keys are required")
@@ -108,8 +124,7 @@ def main():
         with st.chat_message("assistant"):
             with st.spinner("Thinking..."):
                 try:
-                    response = st.session_state.agent.run(prompt)
-                    st.markdown(response)
+                    response = st.write_stream(st.session_state.agent.stream(prompt))
                     
                     # Add assistant response to chat history
                     st.session_state.messages.append({"role": "assistant", "content": response})
@@ -1,14 +1,209 @@
 """
 Google Places API service for interacting with the Google Places API.
 """
+import asyncio
 import os
+import threading
 import googlemaps
-from typing import Dict, List, Optional, Any
+import httpx
+import orjson
+import requests
+from cachetools import LRUCache, TTLCache
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Any, Set
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+# Google Maps Platform REST endpoints used by the async service
+PLACES_API_BASE_URL = "https://maps.googleapis.com/maps/api"
+
+# Fields requested from the Place Details endpoint. Only what the details formatter
+# reads is requested; photos and reviews are by far the largest parts of the payload.
+PLACE_DETAILS_FIELDS = [
+    "name", "formatted_address", "formatted_phone_number",
+    "opening_hours", "website", "rating", "price_level"
+]
+
+# Cache sizes and lifetimes (in seconds) for repeated lookups
+GEOCODE_CACHE_SIZE = 1024
+GEOCODE_CACHE_TTL = 24 * 60 * 60
+DETAILS_CACHE_SIZE = 2048
+DETAILS_CACHE_TTL = 60 * 60
+
+# HTTP settings shared by the Places clients
+REQUEST_TIMEOUT = 5
+MAX_CONNECTIONS = 20
+MAX_KEEPALIVE_CONNECTIONS = 10
+CONNECT_RETRIES = 2
+
+# Attempts for rate-limited (429) or unavailable (503) responses, waiting as long as
+# the Retry-After header asks (up to MAX_RETRY_DELAY seconds)
+RETRY_STATUSES = (429, 503)
+MAX_RETRIES = 3
+MAX_RETRY_DELAY = 10.0
+
+# googlemaps clients keyed by API key, so every service built for a key reuses one
+# requests session and its open connections. Bounded so keys pasted by past
+# visitors do not stay in memory for the life of the process.
+CLIENT_CACHE_SIZE = 32
+_CLIENT_CACHE: LRUCache = LRUCache(maxsize=CLIENT_CACHE_SIZE)
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+class _CappedRetry(Retry):
+    """
+    urllib3 retry policy that honours Retry-After up to MAX_RETRY_DELAY seconds.
+    """
+    def get_retry_after(self, response: Any) -> Optional[float]:
+        """Return the server's requested delay, capped at MAX_RETRY_DELAY."""
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, MAX_RETRY_DELAY)
+
+def _orjson_hook(response: requests.Response, *args: Any, **kwargs: Any) -> requests.Response:
+    """
+    Response hook that makes ``response.json()`` decode with orjson.
+    
+    googlemaps parses every response body with ``response.json()``; this swaps in the
+    faster parser without changing the client itself.
+    
+    Args:
+        response: The response received by the googlemaps client
+        
+    Returns:
+        The same response
+    """
+    response.json = lambda **_: orjson.loads(response.content)
+    return response
+
+def _get_client(api_key: str) -> googlemaps.Client:
+    """
+    Return the shared googlemaps client for an API key, creating it on first use.
+    
+    Args:
+        api_key: Google Places API key
+        
+    Returns:
+        The googlemaps client for the key
+    """
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(api_key)
+        if client is None:
+            client = googlemaps.Client(
+                key=api_key,
+                timeout=REQUEST_TIMEOUT,
+                retry_over_query_limit=True,
+                requests_kwargs={"hooks": {"response": _orjson_hook}}
+            )
+            
+            # googlemaps only retries 5xx responses and ignores Retry-After, so let the
+            # session's adapter retry rate-limited responses the way the server asks
+            client.session.mount("https://", HTTPAdapter(
+                pool_maxsize=MAX_CONNECTIONS,
+                max_retries=_CappedRetry(
+                    total=MAX_RETRIES - 1,
+                    connect=CONNECT_RETRIES,
+                    status_forcelist=RETRY_STATUSES,
+                    backoff_factor=1,
+                    respect_retry_after_header=True,
+                    raise_on_status=False
+                )
+            ))
+            _CLIENT_CACHE[api_key] = client
+        return client
+
+class _AsyncClientCache(LRUCache):
+    """
+    LRU cache of async HTTP clients that closes the clients it evicts.
+    """
+    def popitem(self) -> Any:
+        """Evict the least recently used client and schedule its close."""
+        key, client = super().popitem()
+        # Evictions only happen in _get_async_client, on the loop that owns the clients
+        task = asyncio.get_running_loop().create_task(client.aclose())
+        _CLOSING_CLIENTS.add(task)
+        task.add_done_callback(_CLOSING_CLIENTS.discard)
+        return key, client
+
+# httpx clients keyed by API key, so every async service built for a key shares one
+# connection pool. Clients are bound to the event loop that creates them, so the
+# async services must all run on one long-lived loop; the cache is only touched
+# from that loop and needs no lock. Evicted clients are closed on the same loop.
+_ASYNC_CLIENT_CACHE: _AsyncClientCache = _AsyncClientCache(maxsize=CLIENT_CACHE_SIZE)
+_CLOSING_CLIENTS: Set["asyncio.Task[None]"] = set()
+
+def _get_async_client(api_key: str) -> httpx.AsyncClient:
+    """
+    Return the shared async HTTP client for an API key, creating it on first use.
+    
+    Args:
+        api_key: Google Places API key
+        
+    Returns:
+        The async HTTP client for the key
+    """
+    client = _ASYNC_CLIENT_CACHE.get(api_key)
+    if client is None:
+        client = httpx.AsyncClient(
+            base_url=PLACES_API_BASE_URL,
+            timeout=REQUEST_TIMEOUT,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                retries=CONNECT_RETRIES
+            )
+        )
+        _ASYNC_CLIENT_CACHE[api_key] = client
+    return client
+
+def _retry_delay(response: httpx.Response, attempt: int) -> float:
+    """
+    Work out how long to wait before retrying a request.
+    
+    Args:
+        response: The rate-limited or unavailable response
+        attempt: Number of attempts made so far
+        
+    Returns:
+        Delay in seconds, from the Retry-After header if it has one, else exponential backoff
+    """
+    retry_after = response.headers.get("Retry-After")
+    try:
+        delay = float(retry_after) if retry_after is not None else 2 ** (attempt - 1)
+    except ValueError:
+        # Retry-After may also be an HTTP date; fall back to backoff for those
+        delay = 2 ** (attempt - 1)
+    return min(max(delay, 0.0), MAX_RETRY_DELAY)
+
+class _LockedTTLCache:
+    """
+    Thread-safe wrapper around ``cachetools.TTLCache``.
+    """
+    def __init__(self, maxsize: int, ttl: float):
+        """
+        Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries
+            ttl: Lifetime of an entry in seconds
+        """
+        self._cache: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value for a key, or None if it is missing or expired."""
+        with self._lock:
+            return self._cache.get(key)
+    
+    def set(self, key: str, value: Any) -> None:
+        """Store a value for a key."""
+        with self._lock:
+            self._cache[key] = value
+
 class GooglePlacesService:
     """
     Service for interacting with the Google Places API.
@@ -24,7 +219,11 @@ class GooglePlacesService:
         if not self.api_key:
             raise ValueError("Google Places API key is required. Set it in .env file or pass it as an argument.")
         
-        self.client = googlemaps.Client(key=self.api_key)
+        self.client = _get_client(self.api_key)
+        
+        # Geocodes and place details change rarely, so repeat lookups are served from memory
+        self._geocode_cache = _LockedTTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+        self._details_cache = _LockedTTLCache(maxsize=DETAILS_CACHE_SIZE, ttl=DETAILS_CACHE_TTL)
     
     def find_nearby_places(
         self, 
@@ -67,16 +266,19 @@ class GooglePlacesService:
         Returns:
             Detailed information about the place
         """
+        cached = self._details_cache.get(place_id)
+        if cached is not None:
+            return cached
+        
         place_details = self.client.place(
             place_id=place_id,
-            fields=[
-                "name", "formatted_address", "formatted_phone_number", 
-                "opening_hours", "website", "rating", "reviews", 
-                "price_level", "photos", "geometry"
-            ]
+            fields=PLACE_DETAILS_FIELDS
         )
         
-        return place_details.get("result", {})
+        result = place_details.get("result", {})
+        if result:
+            self._details_cache.set(place_id, result)
+        return result
     
     def geocode_address(self, address: str) -> Optional[tuple[float, float]]:
         """
@@ -88,10 +290,158 @@ class GooglePlacesService:
         Returns:
             Tuple of (latitude, longitude) or None if geocoding failed
         """
+        cached = self._geocode_cache.get(address)
+        if cached is not None:
+            return cached
+        
         geocode_result = self.client.geocode(address)
         
         if not geocode_result:
             return None
         
         location = geocode_result[0]["geometry"]["location"]
-        return location["lat"], location["lng"]
+        coordinates = location["lat"], location["lng"]
+        self._geocode_cache.set(address, coordinates)
+        return coordinates
+
+class AsyncGooglePlacesService:
+    """
+    Asynchronous service for interacting with the Google Places API.
+
+    Calls the Places REST endpoints directly over an ``httpx.AsyncClient`` shared per
+    API key, so several lookups can be awaited together with ``asyncio.gather``.
+    Must be used from a single long-lived event loop.
+    """
+    def __init__(self, api_key: Optional[str] = None):
+        """
+        Initialize the asynchronous Google Places API service.
+        
+        Args:
+            api_key: Google Places API key. If not provided, it will be loaded from environment variables.
+        """
+        self.api_key = api_key or os.getenv("GOOGLE_PLACES_API_KEY")
+        if not self.api_key:
+            raise ValueError("Google Places API key is required. Set it in .env file or pass it as an argument.")
+        
+        # Geocodes and place details change rarely, so repeat lookups are served from memory
+        self._geocode_cache = _LockedTTLCache(maxsize=GEOCODE_CACHE_SIZE, ttl=GEOCODE_CACHE_TTL)
+        self._details_cache = _LockedTTLCache(maxsize=DETAILS_CACHE_SIZE, ttl=DETAILS_CACHE_TTL)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The HTTP client shared by every async service using this API key."""
+        return _get_async_client(self.api_key)
+    
+    async def _get(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Send a GET request to a Places endpoint and return the decoded body.
+        
+        Args:
+            path: Endpoint path relative to the API base URL
+            params: Query parameters, without the API key
+            
+        Returns:
+            The decoded JSON response
+        """
+        attempt = 1
+        while True:
+            response = await self.client.get(path, params={**params, "key": self.api_key})
+            if response.status_code not in RETRY_STATUSES or attempt >= MAX_RETRIES:
+                break
+            
+            # Rate limited or temporarily unavailable; wait as long as the server asks
+            await asyncio.sleep(_retry_delay(response, attempt))
+            attempt += 1
+        
+        if response.status_code != 200:
+            raise googlemaps.exceptions.HTTPError(response.status_code)
+        
+        body = orjson.loads(response.content)
+        status = body.get("status")
+        if status not in ("OK", "ZERO_RESULTS"):
+            raise googlemaps.exceptions.ApiError(status, body.get("error_message"))
+        
+        return body
+    
+    async def find_nearby_places(
+        self, 
+        location: tuple[float, float], 
+        radius: int = 1000, 
+        open_now: bool = True, 
+        type: str = "restaurant",
+        keyword: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Find nearby places based on location and filters.
+        
+        Args:
+            location: Tuple of (latitude, longitude)
+            radius: Search radius in meters
+            open_now: Whether to only return places that are currently open
+            type: Type of place (e.g., "restaurant", "cafe")
+            keyword: Additional keyword to filter results
+            
+        Returns:
+            List of places matching the criteria
+        """
+        params: Dict[str, Any] = {
+            "location": f"{location[0]},{location[1]}",
+            "radius": radius,
+            "type": type
+        }
+        if open_now:
+            params["opennow"] = "true"
+        if keyword:
+            params["keyword"] = keyword
+        
+        places_result = await self._get("/place/nearbysearch/json", params)
+        
+        return places_result.get("results", [])
+    
+    async def get_place_details(self, place_id: str) -> Dict[str, Any]:
+        """
+        Get detailed information about a specific place.
+        
+        Args:
+            place_id: The Google Places ID of the place
+            
+        Returns:
+            Detailed information about the place
+        """
+        cached = self._details_cache.get(place_id)
+        if cached is not None:
+            return cached
+        
+        place_details = await self._get(
+            "/place/details/json",
+            {"place_id": place_id, "fields": ",".join(PLACE_DETAILS_FIELDS)}
+        )
+        
+        result = place_details.get("result", {})
+        if result:
+            self._details_cache.set(place_id, result)
+        return result
+    
+    async def geocode_address(self, address: str) -> Optional[tuple[float, float]]:
+        """
+        Convert an address to geographic coordinates.
+        
+        Args:
+            address: The address to geocode
+            
+        Returns:
+            Tuple of (latitude, longitude) or None if geocoding failed
+        """
+        cached = self._geocode_cache.get(address)
+        if cached is not None:
+            return cached
+        
+        geocode_result = (await self._get("/geocode/json", {"address": address})).get("results", [])
+        
+        if not geocode_result:
+            return None
+        
+        location = geocode_result[0]["geometry"]["location"]
+        coordinates = location["lat"], location["lng"]
+        self._geocode_cache.set(address, coordinates)
+        return coordinates
@@ -1,10 +1,90 @@
 """
 Helper functions for the FindMyDinner application.
 """
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Any, Optional, Tuple, Union
 import re
 
-def format_place_for_display(place: Dict[str, Any]) -> Dict[str, Any]:
+# Distance with a unit, e.g. "5 km" or "500 m"
+_DIST_RE = re.compile(r"(?P<num>\d+(?:\.\d+)?)\s*(?P<unit>km|m)", re.IGNORECASE)
+
+# Display text for each Google price level (0-4); level 0 and missing levels share the first entry
+_PRICE_STR = ("Price not available", "$", "$$", "$$$", "$$$$", "$$$$$")
+
+@dataclass(frozen=True)
+class DisplayPlace:
+    """
+    A place from a nearby search, formatted for display.
+    
+    Every field is immutable, so instances are hashable and safe to share.
+    """
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "address", "rating", "price_level", "place_id", "types", "location")
+    name: str
+    address: str
+    rating: Union[float, str]
+    price_level: str
+    place_id: str
+    types: Tuple[str, ...]
+    location: Optional[Tuple[float, float]]
+
+@dataclass(frozen=True)
+class PlaceDetails:
+    """
+    Detailed information about a place, formatted for display.
+    
+    Every field is immutable, so instances are hashable and safe to share.
+    """
+    # Declared by hand because dataclass(slots=True) needs Python 3.10
+    __slots__ = ("name", "address", "phone", "website", "rating", "price_level", "open_now", "weekday_text")
+    name: str
+    address: str
+    phone: str
+    website: str
+    rating: Union[float, str]
+    price_level: str
+    open_now: bool
+    weekday_text: Tuple[str, ...]
+
+@lru_cache(maxsize=512)
+def _format_place_by_id(
+    place_id: str,
+    name: str,
+    address: str,
+    rating: Any,
+    price_level: Optional[int],
+    types: Tuple[str, ...],
+    location: Optional[Tuple[float, float]]
+) -> DisplayPlace:
+    """
+    Build the display form of a place from its extracted fields.
+    
+    Cached so a restaurant that shows up in several searches is only formatted once.
+    
+    Args:
+        place_id: The Google Places ID of the place
+        name: Name of the place
+        address: Address of the place
+        rating: Rating of the place
+        price_level: Google price level (0-4), if known
+        types: Types of the place
+        location: Tuple of (latitude, longitude), if known
+        
+    Returns:
+        A formatted place with selected fields
+    """
+    return DisplayPlace(
+        name=name,
+        address=address,
+        rating=rating,
+        price_level=_PRICE_STR[price_level] if price_level else _PRICE_STR[0],
+        place_id=place_id,
+        types=types,
+        location=location
+    )
+
+def format_place_for_display(place: Dict[str, Any]) -> DisplayPlace:
     """
     Format a place object for display in the UI.
     
@@ -12,19 +92,28 @@ def format_place_for_display(place: Dict[str, Any]) -> Dict[str, Any]:
         place: The place object from Google Places API
         
     Returns:
-        A formatted place object with selected fields
+        A formatted place with selected fields
     """
-    return {
-        "name": place.get("name", "Unknown"),
-        "address": place.get("vicinity", "No address available"),
-        "rating": place.get("rating", "No rating"),
-        "price_level": "$" * place.get("price_level", 0) if place.get("price_level") else "Price not available",
-        "place_id": place.get("place_id", ""),
-        "types": place.get("types", []),
-        "location": place.get("geometry", {}).get("location", {}) if "geometry" in place else {}
-    }
+    get = place.get
+    place_id = get("place_id", "")
+    
+    location = (get("geometry") or {}).get("location") or {}
+    lat, lng = location.get("lat"), location.get("lng")
+    
+    # Without a place_id there is nothing stable to cache on
+    formatter = _format_place_by_id if place_id else _format_place_by_id.__wrapped__
+    
+    return formatter(
+        place_id,
+        get("name", "Unknown"),
+        get("vicinity", "No address available"),
+        get("rating", "No rating"),
+        get("price_level"),
+        tuple(get("types", ())),
+        (lat, lng) if lat is not None and lng is not None else None
+    )
 
-def format_place_details(place_details: Dict[str, Any]) -> Dict[str, Any]:
+def format_place_details(place_details: Dict[str, Any]) -> PlaceDetails:
     """
     Format detailed place information for display.
     
@@ -32,30 +121,30 @@ def format_place_details(place_details: Dict[str, Any]) -> Dict[str, Any]:
         place_details: The place details from Google Places API
         
     Returns:
-        A formatted place details object with selected fields
+        Formatted place details with selected fields
     """
     # Extract opening hours if available
-    opening_hours = {}
-    if "opening_hours" in place_details and "weekday_text" in place_details["opening_hours"]:
-        opening_hours = {
-            "open_now": place_details["opening_hours"].get("open_now", False),
-            "weekday_text": place_details["opening_hours"].get("weekday_text", [])
-        }
+    opening_hours = place_details.get("opening_hours") or {}
+    if "weekday_text" in opening_hours:
+        open_now = opening_hours.get("open_now", False)
+        weekday_text = tuple(opening_hours["weekday_text"])
+    else:
+        open_now, weekday_text = False, ()
     
     # Format price level
-    price_level = place_details.get("price_level", 0)
-    price_display = "$" * price_level if price_level else "Price not available"
+    price_level = place_details.get("price_level")
+    price_display = _PRICE_STR[price_level] if price_level else _PRICE_STR[0]
     
-    return {
-        "name": place_details.get("name", "Unknown"),
-        "address": place_details.get("formatted_address", "No address available"),
-        "phone": place_details.get("formatted_phone_number", "No phone number available"),
-        "website": place_details.get("website", "No website available"),
-        "rating": place_details.get("rating", "No rating"),
-        "price_level": price_display,
-        "opening_hours": opening_hours,
-        "location": place_details.get("geometry", {}).get("location", {}) if "geometry" in place_details else {}
-    }
+    return PlaceDetails(
+        name=place_details.get("name", "Unknown"),
+        address=place_details.get("formatted_address", "No address available"),
+        phone=place_details.get("formatted_phone_number", "No phone number available"),
+        website=place_details.get("website", "No website available"),
+        rating=place_details.get("rating", "No rating"),
+        price_level=price_display,
+        open_now=open_now,
+        weekday_text=weekday_text
+    )
 
 def parse_distance(distance_text: str) -> Optional[int]:
     """
@@ -68,13 +157,10 @@ def parse_distance(distance_text: str) -> Optional[int]:
         Distance in meters or None if parsing failed
     """
     # Try to match patterns like "5 km" or "500 m"
-    km_match = re.match(r"(\d+(?:\.\d+)?)\s*km", distance_text, re.IGNORECASE)
-    m_match = re.match(r"(\d+(?:\.\d+)?)\s*m", distance_text, re.IGNORECASE)
-    
-    if km_match:
-        return int(float(km_match.group(1)) * 1000)
-    elif m_match:
-        return int(float(m_match.group(1)))
+    match = _DIST_RE.match(distance_text)
+    if match:
+        multiplier = 1000 if match["unit"].lower() == "km" else 1
+        return int(float(match["num"]) * multiplier)
     
     # Try to parse as a plain number (assume meters)
     try:
@@ -96,4 +182,5 @@ def filter_places_by_type(places: List[Dict[str, Any]], place_type: str) -> List
     if not place_type:
         return places
     
-    return [place for place in places if place_type.lower() in [t.lower() for t in place.get("types", [])]]
+    needle = place_type.lower()
+    return [place for place in places if any(t.lower() == needle for t in place.get("types", ()))]